@@ -9,17 +9,63 @@ Multiple endings are supported based on decisions and performance.
 Run: python3 text_rpg.py
 """
 
+import functools
 import random
 import sys
-import textwrap
+from collections import namedtuple
 
 # -----------------------------
 # Utility helpers
 # -----------------------------
 
+# All game randomness goes through _rand so harnesses can install a seeded RNG.
+_rand = random.Random()
+
+def set_rng(rng):
+    """Replace the game's RNG with any random.Random-compatible object."""
+    global _rand
+    _rand = rng
+
+@functools.lru_cache(maxsize=256)
 def wrap(text, width=78):
-    """Wrap long text for nicer terminal display."""
-    return "\n".join(textwrap.wrap(text, width=width))
+    """Wrap long text for nicer terminal display (cached for static strings)."""
+    return wrap_dynamic(text, width)
+
+def wrap_dynamic(text, width=78):
+    """
+    Wrap text that changes between calls (f-strings), bypassing the cache.
+    Greedy single pass over the words: break before a word that would overflow
+    width. Like textwrap, a word longer than width fills the rest of the
+    current line and is split across the following ones.
+    """
+    if width < 1:
+        raise ValueError(f"invalid width {width!r} (must be > 0)")
+    lines = []
+    line = []
+    line_len = 0
+    for word in text.split():
+        n = len(word)
+        if line and line_len + 1 + n > width:
+            room = width - line_len - 1
+            if n > width and room > 0:
+                line.append(word[:room])
+                word = word[room:]
+                n -= room
+            lines.append(" ".join(line))
+            line = []
+            line_len = 0
+        while n > width:
+            lines.append(word[:width])
+            word = word[width:]
+            n -= width
+        if line:
+            line_len += 1 + n
+        else:
+            line_len = n
+        line.append(word)
+    if line:
+        lines.append(" ".join(line))
+    return "\n".join(lines)
 
 def prompt(msg="> "):
     """Get input from the player, handle EOF gracefully."""
@@ -34,26 +80,75 @@ def choose_from(prompt_text, choices):
     Present numbered choices and return the selected key.
     choices: list of tuples (key, description)
     """
-    print(wrap(prompt_text))
+    choices = tuple(choices)
+    sys.stdout.write(_render_menu(prompt_text, choices) + "\n")
+    return _read_choice(choices)
+
+@functools.lru_cache(maxsize=64)
+def _render_menu(prompt_text, choices):
+    """Build the menu text once per (prompt, choices) pair; choices must be a tuple."""
+    lines = [wrap(prompt_text)]
     for i, (key, desc) in enumerate(choices, 1):
-        print(f"  {i}) {desc}")
+        lines.append(f"  {i}) {desc}")
+    return "\n".join(lines)
+
+@functools.lru_cache(maxsize=64)
+def _choice_keymap(choices):
+    """Map lowercased keys to keys for a choices tuple."""
+    return {key.lower(): key for key, desc in choices}
+
+def _read_choice(choices):
+    """Prompt until the player picks a valid entry from an already-shown menu (choices must be a tuple)."""
+    keymap = _choice_keymap(choices)
+    n = len(choices)
     while True:
         ans = prompt("> ")
         if ans.isdigit():
             idx = int(ans) - 1
-            if 0 <= idx < len(choices):
+            if 0 <= idx < n:
                 return choices[idx][0]
         # allow direct key match (case-insensitive)
-        for key, desc in choices:
-            if ans.lower() == key.lower():
-                return key
+        matched = keymap.get(ans.lower())
+        if matched is not None:
+            return matched
         print("That's not a valid command. Please choose a number or option name.")
 
+# -----------------------------
+# Narrative text (wrapped once at import)
+# -----------------------------
+
+_FOREST_INTRO = wrap("You enter the Haunted Forest. Fog curls between twisted trees; soft whispers brush your ears.")
+_CASTLE_INTRO = wrap("You approach the Enchanted Castle: banners flutter though there is no wind.")
+_BANDIT_INTRO = wrap("You find the Bandit's Lair — torches, crude flags, and the clink of coins.")
+_CAVERN_INTRO = wrap("The cavern smells of sulfur. A massive dragon stirs, its eyes rolling open.")
+_DRAGON_BEFRIENDED = wrap("Your words and actions calm the dragon. It regards you with ancient curiosity.")
+_WELCOME = wrap("Welcome to 'Echoes of Ember' — a short text-based RPG.")
+_CHAPTER_ONE_TITLE = wrap("CHAPTER 1: The Road and the Fork")
+_CHAPTER_ONE_FORK = wrap("You travel a winding road and come to a fork leading to three destinations:")
+_CHAPTER_TWO_TITLE = wrap("CHAPTER 2: The Cavern of Echoes")
+_ENDING_PROTECTOR = wrap("With knowledge from the castle and the dragon's trust, you become a protector of ancient lore. The kingdom thrives under your guidance.")
+_ENDING_HERO = wrap("Having bathed in the dragon's blood and proven your strength at the castle, ballads are sung of your deeds. You are a celebrated hero.")
+_ENDING_OUTLAW = wrap("You escaped with the Dragon Amulet. Richer and notorious, you live a life on the run — wealthy but hunted.")
+_ENDING_FALLEN = wrap("Your journey ends in darkness. Your story becomes a cautionary tale told in hushed whispers.")
+_ENDING_OPEN = wrap("Your path was uneven — some choices bore fruit, others cost you dearly. The road ahead remains open; your story continues in whispered possibilities.")
+_HELP_HEADER = wrap("Available commands while not in combat:")
+_HELP_TEXT = "\n".join([
+    _HELP_HEADER,
+    "  inventory  - list items",
+    "  use <name> - use an item by name (e.g., 'use potion')",
+    "  drop <name> - discard an item",
+    "  stats - show character stats",
+    "  explore - continue with next chapter/action",
+    "  quit - exit game",
+]) + "\n"
+
 # -----------------------------
 # Data models: Items, Player, Enemy
 # -----------------------------
 
 class Item:
+    __slots__ = ("name", "description", "effect", "consumable")
+
     def __init__(self, name, description="", effect=None, consumable=True):
         self.name = name
         self.description = description
@@ -67,6 +162,8 @@ class Item:
         return False
 
 class Enemy:
+    __slots__ = ("name", "hp", "max_hp", "attack", "defense", "magic", "special", "loot")
+
     def __init__(self, name, hp, attack, defense, magic=0, special=None, loot=None):
         self.name = name
         self.hp = hp
@@ -81,28 +178,49 @@ class Enemy:
         return self.hp > 0
 
     def take_damage(self, dmg):
-        self.hp = max(self.hp - dmg, 0)
+        v = self.hp - dmg
+        self.hp = v if v > 0 else 0
 
     def perform_special(self, player):
         if callable(self.special):
             return self.special(self, player)
         return None
 
+    def clone(self):
+        """Fresh full-HP copy of this enemy for a new encounter (loot list is shared)."""
+        return Enemy(self.name, self.max_hp, self.attack, self.defense, self.magic, self.special, self.loot)
+
 class Player:
+    __slots__ = ("name", "role", "level", "exp", "stats", "abilities",
+                 "strength", "agility", "magic", "endurance", "max_hp", "hp",
+                 "inventory", "_inv_index", "equipped", "alive", "path_flags",
+                 "attack_damage")
+
     def __init__(self, name, role, stats, abilities):
         self.name = name
         self.role = role
         self.level = 1
         self.exp = 0
+        self.equipped = None
         self.stats = stats  # dict: Strength, Agility, Magic, Endurance
-        self.abilities = abilities  # dict of special abilities and descriptions
-        self.max_hp = 10 + stats.get("Endurance", 0) * 2
+        self._sync_stats()
+        self.abilities = abilities  # tuple of Ability records
+        self.max_hp = 10 + self.endurance * 2
         self.hp = self.max_hp
-        self.inventory = []
-        self.equipped = None
+        self.inventory = []  # ordered list for display
+        self._inv_index = {}  # lowercase name -> inventory positions, for O(1) lookup
         self.alive = True
         self.path_flags = {}  # track decision flags for endings
 
+    def _sync_stats(self):
+        """Mirror the stats dict onto attributes; call after changing self.stats."""
+        stats = self.stats
+        self.strength = stats.get("Strength", 1)
+        self.agility = stats.get("Agility", 0)
+        self.magic = stats.get("Magic", 0)
+        self.endurance = stats.get("Endurance", 0)
+        self.attack_damage = _make_attack_fn(self)
+
     def is_alive(self):
         return self.hp > 0
 
@@ -111,50 +229,76 @@ class Player:
         return self.hp
 
     def take_damage(self, dmg):
-        self.hp = max(self.hp - dmg, 0)
-        if self.hp == 0:
-            self.alive = False
+        v = self.hp - dmg
+        self.hp = v if v > 0 else 0
+        self.alive = v > 0
 
     def add_item(self, item):
+        self._inv_index.setdefault(item.name.lower(), []).append(len(self.inventory))
         self.inventory.append(item)
 
     def remove_item(self, item_name):
-        for i, it in enumerate(self.inventory):
-            if it.name.lower() == item_name.lower():
-                return self.inventory.pop(i)
-        return None
+        lst = self._inv_index.get(item_name.lower())
+        if not lst:
+            return None
+        return self.pop_item(lst[0])
+
+    def pop_item(self, idx):
+        """
+        Remove and return the item at inventory position idx.
+        The last item is swapped into the hole, so inventory order is not preserved.
+        """
+        inv = self.inventory
+        index = self._inv_index
+        item = inv[idx]
+        key = item.name.lower()
+        lst = index[key]
+        lst.remove(idx)
+        if not lst:
+            del index[key]
+        last = inv.pop()
+        if idx < len(inv):
+            inv[idx] = last
+            moved = index[last.name.lower()]
+            moved[moved.index(len(inv))] = idx
+        return item
 
     def list_inventory(self):
         if not self.inventory:
             print("Your inventory is empty.")
             return
-        print("Inventory:")
-        for i, it in enumerate(self.inventory, 1):
-            print(f"  {i}) {it.name} - {it.description}")
+        lines = ["Inventory:"]
+        lines.extend(f"  {i}) {it.name} - {it.description}" for i, it in enumerate(self.inventory, 1))
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def get_item(self, name):
-        for it in self.inventory:
-            if it.name.lower() == name.lower():
-                return it
-        return None
+        lst = self._inv_index.get(name.lower())
+        return self.inventory[lst[0]] if lst else None
 
     def equip_weapon(self, weapon):
         self.equipped = weapon
+        self.attack_damage = _make_attack_fn(self)
 
-    def attack_damage(self):
-        base = self.stats.get("Strength", 1)
-        weapon_bonus = 0
-        if self.equipped and hasattr(self.equipped, "attack_bonus"):
-            weapon_bonus = getattr(self.equipped, "attack_bonus", 0)
+def _make_attack_fn(player):
+    """
+    Build player.attack_damage() with the current Strength, Agility and weapon
+    bonus baked in. Rebuilt by Player whenever stats or the weapon change.
+    """
+    base = player.strength + getattr(player.equipped, "attack_bonus", 0)
+    sides = player.agility + 1
+
+    def attack_damage():
         # damage includes small randomness
-        return max(1, base + weapon_bonus + random.randint(0, self.stats.get("Agility", 0)))
+        dmg = base + int(_rand.random() * sides)
+        return dmg if dmg > 1 else 1
+    return attack_damage
 
 # -----------------------------
 # Items and effects definitions
 # -----------------------------
 
 def potion_effect(player, _target=None):
-    amt = 6 + player.stats.get("Magic", 0) // 2
+    amt = 6 + player.magic // 2
     healed = min(player.max_hp - player.hp, amt)
     player.heal(amt)
     print(f"You drink the potion and recover {healed} HP (now {player.hp}/{player.max_hp}).")
@@ -168,6 +312,8 @@ def elixir_effect(player, _target=None):
 
 # Special weapon item class with attack bonus
 class Weapon(Item):
+    __slots__ = ("attack_bonus",)
+
     def __init__(self, name, description, attack_bonus=0):
         super().__init__(name, description, effect=None, consumable=False)
         self.attack_bonus = attack_bonus
@@ -183,31 +329,86 @@ DRAGON_AMULET = Item("Dragon Amulet", "An old amulet pulsing with dragon magic."
 # Combat system
 # -----------------------------
 
-def combat(player, enemy):
-    """Turn-based combat. Returns True if player wins, False if player dies or flees unsuccessfully."""
-    print(wrap(f"A {enemy.name} stands before you! (HP: {enemy.hp}/{enemy.max_hp})"))
-    while player.is_alive() and enemy.is_alive():
-        print("\nYour turn.")
-        print(f"  HP: {player.hp}/{player.max_hp} | Enemy HP: {enemy.hp}/{enemy.max_hp}")
-        actions = [("attack", "Attack the enemy"),
+def _resolve_attack(dmg, agility, enemy_defense, crit_roll):
+    """Numeric core of a player hit. Returns (net damage, crit flag)."""
+    # enemy defense reduces damage
+    net = dmg - enemy_defense
+    net = net if net > 0 else 0
+    # small crit chance based on agility
+    crit = crit_roll <= max(2, agility // 2)
+    if crit:
+        net += 3
+    return net, crit
+
+def _resolve_enemy_hit(enemy_attack, endurance, variance, defended):
+    """Numeric core of a basic enemy hit against the player."""
+    # base enemy damage with randomness and player's defense if defending
+    dmg = enemy_attack + variance - (endurance // 2)
+    dmg = dmg if dmg > 0 else 0
+    # if player defended, reduce
+    if defended:
+        dmg = dmg // 2
+    return dmg
+
+def _resolve_flee(agility, enemy_attack, roll):
+    """Numeric core of a flee attempt. roll is 1-100; returns True on escape."""
+    # flee chance depends on agility vs enemy attack
+    flee_chance = 50 + (agility - enemy_attack) * 5
+    return roll <= max(10, min(90, flee_chance))
+
+def simulate_combats(player, enemy, n):
+    """
+    Play n attack-only fights without any I/O and return how many the player wins.
+    Enemy specials, items and fleeing are ignored; player and enemy are not modified.
+    """
+    rand = _rand.random  # int(rand() * k) is a cheaper d(k) than randint
+    wins = 0
+    for _ in range(n):
+        p_hp = player.hp
+        e_hp = enemy.hp
+        while p_hp > 0:
+            net, _crit = _resolve_attack(player.attack_damage(), player.agility,
+                                         enemy.defense, 1 + int(rand() * 20))
+            e_hp -= net
+            if e_hp <= 0:
+                wins += 1
+                break
+            p_hp -= _resolve_enemy_hit(enemy.attack, player.endurance, int(rand() * 4) - 1, False)
+    return wins
+
+_COMBAT_ACTIONS = (("attack", "Attack the enemy"),
                    ("defend", "Brace to reduce incoming damage this turn"),
                    ("use", "Use item from inventory"),
-                   ("run", "Attempt to flee")]
-        # Add magic/special if player has abilities
-        if player.abilities:
-            actions.append(("ability", "Use a class ability"))
-        choice = choose_from("Choose an action:", actions)
+                   ("run", "Attempt to flee"))
+_COMBAT_ACTIONS_WITH_ABILITY = _COMBAT_ACTIONS + (("ability", "Use a class ability"),)
+_COMBAT_MENU = _render_menu("Choose an action:", _COMBAT_ACTIONS)
+_COMBAT_MENU_WITH_ABILITY = _render_menu("Choose an action:", _COMBAT_ACTIONS_WITH_ABILITY)
+
+def combat(player, enemy):
+    """Turn-based combat. Returns True if player wins, False if player dies or flees unsuccessfully."""
+    rand = _rand.random  # int(rand() * k) is a cheaper d(k) than randint
+    # Add magic/special if player has abilities
+    if player.abilities:
+        menu, actions = _COMBAT_MENU_WITH_ABILITY, _COMBAT_ACTIONS_WITH_ABILITY
+    else:
+        menu, actions = _COMBAT_MENU, _COMBAT_ACTIONS
+    # HP is tracked in locals and re-read only after calls that may change it
+    # (take_damage, items, abilities, enemy specials).
+    p_hp, p_max = player.hp, player.max_hp
+    e_hp, e_max = enemy.hp, enemy.max_hp
+    e_atk, e_def = enemy.attack, enemy.defense
+    agility, endurance = player.agility, player.endurance
+    print(wrap_dynamic(f"A {enemy.name} stands before you! (HP: {e_hp}/{e_max})"))
+    while p_hp > 0 and e_hp > 0:
+        sys.stdout.write(f"\nYour turn.\n  HP: {p_hp}/{p_max} | Enemy HP: {e_hp}/{e_max}\n{menu}\n")
+        choice = _read_choice(actions)
         defended = False
         if choice == "attack":
-            dmg = player.attack_damage()
-            # enemy defense reduces damage
-            net = max(0, dmg - enemy.defense)
-            # small crit chance based on agility
-            crit_roll = random.randint(1, 20)
-            if crit_roll <= max(2, player.stats.get("Agility", 1) // 2):
-                net += 3
+            net, crit = _resolve_attack(player.attack_damage(), agility, e_def, 1 + int(rand() * 20))
+            if crit:
                 print("Critical strike!")
             enemy.take_damage(net)
+            e_hp = enemy.hp
             print(f"You strike the {enemy.name} for {net} damage.")
         elif choice == "defend":
             defended = True
@@ -227,7 +428,7 @@ def combat(player, enemy):
                         item = player.inventory[idx]
                         consumed = item.use(player, enemy)
                         if consumed:
-                            player.inventory.pop(idx)
+                            player.pop_item(idx)
                     else:
                         print("Invalid item number.")
                 else:
@@ -238,42 +439,39 @@ def combat(player, enemy):
                             player.remove_item(item.name)
                     else:
                         print("You don't have that item.")
+                p_hp, e_hp = player.hp, enemy.hp
         elif choice == "ability":
             # simplistic ability handling: each ability has a name and function
             if not player.abilities:
                 print("You have no abilities.")
             else:
-                keys = list(player.abilities.keys())
-                choices = [(k, f"{k} - {player.abilities[k]['desc']}") for k in keys]
+                abilities = player.abilities
+                choices = [(ab.key, f"{ab.key} - {ab.desc}") for ab in abilities]
                 ability_key = choose_from("Choose an ability to use:", choices)
-                ability = player.abilities.get(ability_key)
-                if ability and callable(ability.get("func")):
-                    # ability function returns message or effects
-                    ability["func"](player, enemy)
+                for ab in abilities:
+                    if ab.key == ability_key:
+                        # ability function returns message or effects
+                        ab.func(player, enemy)
+                        break
+                p_hp, e_hp = player.hp, enemy.hp
         elif choice == "run":
-            # flee chance depends on agility vs enemy attack
-            flee_chance = 50 + (player.stats.get("Agility", 0) - enemy.attack) * 5
-            roll = random.randint(1, 100)
-            if roll <= max(10, min(90, flee_chance)):
+            if _resolve_flee(agility, e_atk, 1 + int(rand() * 100)):
                 print("You successfully fled the battle.")
                 return False  # not a win, but survived
             else:
                 print("You fail to escape!")
 
         # Enemy's turn if still alive
-        if enemy.is_alive():
-            if enemy.special and random.random() < 0.2:  # 20% chance of special
+        if e_hp > 0:
+            if enemy.special and rand() < 0.2:  # 20% chance of special
                 enemy.perform_special(player)
             else:
-                # base enemy damage with randomness and player's defense if defending
-                dmg = max(0, enemy.attack + random.randint(-1, 2) - (player.stats.get("Endurance", 0) // 2))
-                # if player defended, reduce
-                if 'defended' in locals() and defended:
-                    dmg = max(0, dmg // 2)
+                dmg = _resolve_enemy_hit(e_atk, endurance, int(rand() * 4) - 1, defended)
                 player.take_damage(dmg)
-                print(f"The {enemy.name} hits you for {dmg} damage. (HP: {player.hp}/{player.max_hp})")
+                print(f"The {enemy.name} hits you for {dmg} damage. (HP: {player.hp}/{p_max})")
+            p_hp = player.hp
 
-    if player.is_alive():
+    if p_hp > 0:
         print(f"You defeated the {enemy.name}!")
         # loot drop
         for it in enemy.loot:
@@ -290,31 +488,41 @@ def combat(player, enemy):
 
 def bandit_special(enemy, player):
     # bandit tries to steal an item
-    if player.inventory and random.random() < 0.4:
-        stolen = random.choice(player.inventory)
+    if player.inventory and _rand.random() < 0.4:
+        stolen = _rand.choice(player.inventory)
         player.remove_item(stolen.name)
         print(f"The {enemy.name} deftly steals your {stolen.name}!")
     else:
         # regular hit
-        dmg = max(1, enemy.attack + random.randint(0, 2))
+        dmg = max(1, enemy.attack + _rand.randint(0, 2))
         player.take_damage(dmg)
         print(f"The {enemy.name} slashes you for {dmg} damage.")
 
 def dragon_breath(enemy, player):
-    dmg = 8 + random.randint(0, 6)
+    dmg = 8 + _rand.randint(0, 6)
     player.take_damage(dmg)
-    print(wrap(f"The {enemy.name} breathes fire! You take {dmg} fire damage."))
+    print(wrap_dynamic(f"The {enemy.name} breathes fire! You take {dmg} fire damage."))
+
+# Enemy templates; areas spawn encounters with _ENEMY_TEMPLATES[name].clone()
+_ENEMY_TEMPLATES = {
+    "Dire Wolf": Enemy("Dire Wolf", hp=12, attack=4, defense=1, loot=[HEAL_POTION]),
+    "Spectral Knight": Enemy("Spectral Knight", hp=20, attack=6, defense=2, loot=[SHORT_SWORD]),
+    "Bandit Thug": Enemy("Bandit Thug", hp=10, attack=3, defense=0, special=bandit_special, loot=[HEAL_POTION]),
+    "Bandit Captain": Enemy("Bandit Captain", hp=14, attack=5, defense=1, loot=[WOODEN_SHIELD]),
+    "Ancient Dragon": Enemy("Ancient Dragon", hp=40, attack=8, defense=3, special=dragon_breath,
+                            loot=[DRAGON_AMULET, ELIXIR]),
+}
 
 # -----------------------------
 # Areas and Encounters
 # -----------------------------
 
 def haunted_forest(player):
-    print(wrap("You enter the Haunted Forest. Fog curls between twisted trees; soft whispers brush your ears."))
+    print(_FOREST_INTRO)
     # small encounter: wolves or find potion
-    event_roll = random.randint(1, 100)
+    event_roll = _rand.randint(1, 100)
     if event_roll <= 40:
-        wolf = Enemy("Dire Wolf", hp=12, attack=4, defense=1, loot=[HEAL_POTION])
+        wolf = _ENEMY_TEMPLATES["Dire Wolf"].clone()
         combat(player, wolf)
     elif event_roll <= 75:
         print("You find an old satchel near a tree stump containing a Potion.")
@@ -322,10 +530,11 @@ def haunted_forest(player):
     else:
         print("A ghost appears and offers to test your heart. You feel strangely wiser.")
         player.stats["Magic"] += 1
+        player._sync_stats()
         print("Your Magic increases by 1.")
 
 def enchanted_castle(player):
-    print(wrap("You approach the Enchanted Castle: banners flutter though there is no wind."))
+    print(_CASTLE_INTRO)
     # Decision point with branching path
     choice = choose_from("At the gate a spectral knight asks your intent. How do you respond?",
                          [("fight", "Declare you intend to conquer the castle"),
@@ -333,18 +542,19 @@ def enchanted_castle(player):
                           ("trick", "Attempt to trick the knight")]
                          )
     if choice == "fight":
-        knight = Enemy("Spectral Knight", hp=20, attack=6, defense=2, loot=[SHORT_SWORD])
+        knight = _ENEMY_TEMPLATES["Spectral Knight"].clone()
         combat(player, knight)
         # flag for ending influence
         player.path_flags["castle_blooded"] = True
     elif choice == "peace":
         print("The knight smiles and escorts you into the library where you learn an arcane secret.")
         player.stats["Magic"] += 2
+        player._sync_stats()
         player.path_flags["castle_scholar"] = True
     else:
         print("You attempt to trick the knight. The knight sees through you and laughs, but grants a test of wit.")
         # puzzle-like random chance
-        if random.random() < 0.6 + player.stats.get("Agility", 0) * 0.02:
+        if _rand.random() < 0.6 + player.agility * 0.02:
             print("You solved the test! A minor artifact is yours.")
             player.add_item(Item("Runestone", "A small runestone that hums with energy."))
             player.path_flags["castle_clever"] = True
@@ -353,17 +563,17 @@ def enchanted_castle(player):
             player.take_damage(3)
 
 def bandit_lair(player):
-    print(wrap("You find the Bandit's Lair — torches, crude flags, and the clink of coins."))
+    print(_BANDIT_INTRO)
     # Multiple enemies with varying difficulties
-    bandit1 = Enemy("Bandit Thug", hp=10, attack=3, defense=0, special=bandit_special, loot=[HEAL_POTION])
-    bandit2 = Enemy("Bandit Captain", hp=14, attack=5, defense=1, loot=[WOODEN_SHIELD])
+    bandit1 = _ENEMY_TEMPLATES["Bandit Thug"].clone()
+    bandit2 = _ENEMY_TEMPLATES["Bandit Captain"].clone()
     # optional stealth approach
     approach = choose_from("Do you sneak in or barge into the lair?",
                            [("sneak", "Sneak in quietly (higher chance to avoid combat)"),
                             ("barge", "Barge in and fight")]
                            )
     if approach == "sneak":
-        success = random.random() < 0.5 + (player.stats.get("Agility", 0) * 0.05)
+        success = _rand.random() < 0.5 + (player.agility * 0.05)
         if success:
             print("You slip past sentries and steal a small sack of coins and a Potion.")
             player.add_item(HEAL_POTION)
@@ -376,7 +586,7 @@ def bandit_lair(player):
         combat(player, bandit2)
 
 def dragon_cavern(player):
-    print(wrap("The cavern smells of sulfur. A massive dragon stirs, its eyes rolling open."))
+    print(_CAVERN_INTRO)
     # Decision: fight, befriend, or sneak steal amulet
     choice = choose_from("The dragon awakes. What do you do?",
                          [("fight", "Draw weapon and attack the dragon"),
@@ -384,8 +594,8 @@ def dragon_cavern(player):
                           ("steal", "Try to steal the amulet while it's still waking")]
                          )
     if choice == "steal":
-        chance = 30 + player.stats.get("Agility", 0) * 5
-        if random.randint(1, 100) <= chance:
+        chance = 30 + player.agility * 5
+        if _rand.randint(1, 100) <= chance:
             print("You quietly take the Dragon Amulet from a nearby pedestal without waking the dragon!")
             player.add_item(DRAGON_AMULET)
             player.path_flags["amulet_stolen"] = True
@@ -395,9 +605,9 @@ def dragon_cavern(player):
             # continue to fight
     if choice == "befriend":
         # Use charisma-ish logic via Magic or Agility
-        charm = player.stats.get("Magic", 0) + player.stats.get("Agility", 0)
-        if random.randint(1, 100) <= 30 + charm * 5:
-            print(wrap("Your words and actions calm the dragon. It regards you with ancient curiosity."))
+        charm = player.magic + player.agility
+        if _rand.randint(1, 100) <= 30 + charm * 5:
+            print(_DRAGON_BEFRIENDED)
             player.path_flags["dragon_friend"] = True
             # dragon gives a quest and leaves you with a boon
             player.add_item(Item("Dragon's Mark", "A small token of the dragon's favor."))
@@ -405,8 +615,7 @@ def dragon_cavern(player):
         else:
             print("The dragon is unimpressed. It prepares to strike.")
     # If choose fight or failed befriending/steal
-    dragon = Enemy("Ancient Dragon", hp=40, attack=8, defense=3, special=dragon_breath,
-                   loot=[DRAGON_AMULET, ELIXIR])
+    dragon = _ENEMY_TEMPLATES["Ancient Dragon"].clone()
     won = combat(player, dragon)
     if won:
         player.path_flags["dragon_slain"] = True
@@ -427,14 +636,14 @@ def warrior_shout(player, enemy):
 
 def mage_bolt(player, enemy):
     # mage ability: magic bolt ignoring some defense
-    dmg = 4 + player.stats.get("Magic", 0) + random.randint(0, 4)
+    dmg = 4 + player.magic + _rand.randint(0, 4)
     enemy.take_damage(dmg)
     print(f"You cast a crackling bolt of magic for {dmg} damage.")
 
 def rogue_trick(player, enemy):
     # rogue ability: chance to stun (skip enemy turn)
     print("You perform a quick feint.")
-    if random.random() < 0.4 + player.stats.get("Agility", 0) * 0.02:
+    if _rand.random() < 0.4 + player.agility * 0.02:
         print("You surprise the enemy and strike while they're stunned!")
         dmg = player.attack_damage() + 2
         enemy.take_damage(dmg)
@@ -442,18 +651,21 @@ def rogue_trick(player, enemy):
     else:
         print("The feint fails. No extra effect.")
 
+# key: name shown and typed in the ability menu; func: function(player, enemy)
+Ability = namedtuple("Ability", "key desc func")
+
 CLASS_OPTIONS = {
     "Warrior": {
         "stats": {"Strength": 6, "Agility": 3, "Magic": 1, "Endurance": 5},
-        "abilities": {"Battle Cry": {"desc": "A powerful attack that deals bonus damage.", "func": warrior_shout}}
+        "abilities": (Ability("Battle Cry", "A powerful attack that deals bonus damage.", warrior_shout),)
     },
     "Mage": {
         "stats": {"Strength": 2, "Agility": 3, "Magic": 7, "Endurance": 3},
-        "abilities": {"Magic Bolt": {"desc": "A ranged magic attack that ignores some defense.", "func": mage_bolt}}
+        "abilities": (Ability("Magic Bolt", "A ranged magic attack that ignores some defense.", mage_bolt),)
     },
     "Rogue": {
         "stats": {"Strength": 4, "Agility": 7, "Magic": 2, "Endurance": 3},
-        "abilities": {"Trick": {"desc": "A deceptive strike that may stun or deal extra damage.", "func": rogue_trick}}
+        "abilities": (Ability("Trick", "A deceptive strike that may stun or deal extra damage.", rogue_trick),)
     }
 }
 
@@ -462,7 +674,7 @@ CLASS_OPTIONS = {
 # -----------------------------
 
 def prologue():
-    print(wrap("Welcome to 'Echoes of Ember' — a short text-based RPG."))
+    print(_WELCOME)
     name = prompt("What is your name, adventurer? ")
     # choose class
     print("Choose your class:")
@@ -481,8 +693,8 @@ def prologue():
         print("That's not a valid command. Type the class name or number.")
 
     data = CLASS_OPTIONS[role]
-    player = Player(name=name or "Nameless", role=role, stats=data["stats"].copy(), abilities=data["abilities"].copy())
-    print(wrap(f"You are {player.name}, the {player.role}. Your adventure begins."))
+    player = Player(name=name or "Nameless", role=role, stats=data["stats"].copy(), abilities=data["abilities"])
+    print(wrap_dynamic(f"You are {player.name}, the {player.role}. Your adventure begins."))
     # starting items
     player.add_item(HEAL_POTION)
     player.add_item(SHORT_SWORD)
@@ -490,8 +702,8 @@ def prologue():
     return player
 
 def chapter_one(player):
-    print(wrap("CHAPTER 1: The Road and the Fork"))
-    print(wrap("You travel a winding road and come to a fork leading to three destinations:"))
+    print(_CHAPTER_ONE_TITLE)
+    print(_CHAPTER_ONE_FORK)
     choice = choose_from("Where do you go?",
                          [("forest", "Haunted Forest"),
                           ("castle", "Enchanted Castle"),
@@ -505,7 +717,7 @@ def chapter_one(player):
         bandit_lair(player)
 
 def chapter_two(player):
-    print(wrap("CHAPTER 2: The Cavern of Echoes"))
+    print(_CHAPTER_TWO_TITLE)
     result = dragon_cavern(player)
     return result
 
@@ -516,23 +728,23 @@ def epilogue(player):
     # Determine endings: At least three distinct endings
     # Ending A: Befriended dragon + scholar -> "Dragon's Protector" ending
     if player.path_flags.get("dragon_friend") and player.path_flags.get("castle_scholar"):
-        print(wrap("With knowledge from the castle and the dragon's trust, you become a protector of ancient lore. The kingdom thrives under your guidance."))
+        print(_ENDING_PROTECTOR)
         ending = "Protector"
     # Ending B: Slain dragon + castle_blooded -> "Hero's Victory"
     elif player.path_flags.get("dragon_slain") and player.path_flags.get("castle_blooded"):
-        print(wrap("Having bathed in the dragon's blood and proven your strength at the castle, ballads are sung of your deeds. You are a celebrated hero."))
+        print(_ENDING_HERO)
         ending = "Hero"
     # Ending C: Stole amulet and fled -> "Wanted Outlaw"
     elif player.path_flags.get("amulet_stolen"):
-        print(wrap("You escaped with the Dragon Amulet. Richer and notorious, you live a life on the run — wealthy but hunted."))
+        print(_ENDING_OUTLAW)
         ending = "Outlaw"
     # Ending D: You died or failed crucial fights -> "Fallen"
     elif not player.is_alive():
-        print(wrap("Your journey ends in darkness. Your story becomes a cautionary tale told in hushed whispers."))
+        print(_ENDING_FALLEN)
         ending = "Fallen"
     # Ending E: Neutral endings based on other flags
     else:
-        print(wrap("Your path was uneven — some choices bore fruit, others cost you dearly. The road ahead remains open; your story continues in whispered possibilities."))
+        print(_ENDING_OPEN)
         ending = "Open"
     print(f"\nEnding achieved: {ending}")
     print("\nThank you for playing Echoes of Ember.")
@@ -542,13 +754,7 @@ def epilogue(player):
 # -----------------------------
 
 def show_help():
-    print(wrap("Available commands while not in combat:"))
-    print("  inventory  - list items")
-    print("  use <name> - use an item by name (e.g., 'use potion')")
-    print("  drop <name> - discard an item")
-    print("  stats - show character stats")
-    print("  explore - continue with next chapter/action")
-    print("  quit - exit game")
+    sys.stdout.write(_HELP_TEXT)
 
 def main_loop(player):
     print("\nType 'help' at any time for commands.\n")